@@ -1,16 +1,101 @@
 import os
+import re
+import ctypes
+import errno
+import io
 import shutil
+import sqlite3
 import string
+import subprocess
+import sys
 import hashlib
+import itertools
+import json
+import math
+import operator
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 try:
     from PIL import Image
     from PIL.ExifTags import TAGS
+    import PIL
     PIL_AVAILABLE = True
+    # Pillow-SIMD releases carry a ".postN" version suffix
+    PIL_SIMD = '.post' in getattr(PIL, '__version__', '')
 except ImportError:
     PIL_AVAILABLE = False
+    PIL_SIMD = False
+try:
+    import exifread
+    EXIFREAD_AVAILABLE = True
+except ImportError:
+    EXIFREAD_AVAILABLE = False
+# exiftool is a separate program; when it's on PATH, EXIF dates for a whole
+# folder are read in one call instead of opening each file from Python
+EXIFTOOL = shutil.which('exiftool')
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+# DCT-II basis for the 8 lowest frequencies over 32 samples, used by compute_phash
+_PHASH_COS = [[math.cos((2 * x + 1) * u * math.pi / 64) for x in range(32)] for u in range(8)]
+
+# Number of set bits in an int (int.bit_count is Python 3.10+)
+_popcount = getattr(int, 'bit_count', None) or (lambda n: bin(n).count('1'))
+
+
+def compute_phash(image_path):
+    """
+    Compute a 64-bit perceptual hash (pHash) of an image.
+    
+    The image is shrunk to 32x32 grayscale and the 8x8 lowest-frequency DCT
+    coefficients are taken; each bit records whether one is above their
+    median. Resized or re-saved copies of a picture land only a few bits apart.
+    
+    Args:
+        image_path: Path to the image file, or its contents as bytes
+        
+    Returns:
+        int: 64-bit hash, or None if Pillow is missing or can't decode the image
+    """
+    if not PIL_AVAILABLE:
+        return None
+    try:
+        # Raw bytes come from a single reader thread when the disk can't take parallel reads
+        source = io.BytesIO(image_path) if isinstance(image_path, bytes) else image_path
+        with Image.open(source) as img:
+            # For JPEGs, let libjpeg decode straight to grayscale at 1/2-1/8
+            # scale (in the DCT domain) instead of building full-size pixels
+            # that are thrown away by the resize; other formats ignore this
+            img.draft('L', (64, 64))
+            pixels = list(img.convert('L').resize((32, 32), Image.LANCZOS).getdata())
+    except Exception:
+        return None
+    
+    # Separable DCT, computing only the 8 lowest frequencies in each direction
+    row_coeffs = [[sum(map(operator.mul, pixels[y * 32:(y + 1) * 32], basis)) for basis in _PHASH_COS]
+                  for y in range(32)]
+    columns = list(zip(*row_coeffs))
+    coeffs = [sum(map(operator.mul, basis, column)) for basis in _PHASH_COS for column in columns]
+    
+    ordered = sorted(coeffs)
+    median = (ordered[31] + ordered[32]) / 2
+    phash = 0
+    for coeff in coeffs:
+        phash = (phash << 1) | (coeff > median)
+    return phash
 
 
 class DesktopImageOrganizer:
@@ -23,6 +108,83 @@ class DesktopImageOrganizer:
                        '.tif', '.webp', '.svg', '.ico', '.heic', '.raw', 
                        '.cr2', '.nef', '.orf', '.sr2'}
     
+    # Camera formats that carry EXIF dates; for anything else (screenshots,
+    # icons, web graphics) get_image_date goes straight to file dates
+    EXIF_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.tiff', '.tif', '.heic', '.raw',
+                                 '.cr2', '.nef', '.orf', '.sr2'})
+    
+    # Files smaller than this are placeholders or thumbnails, not worth opening for EXIF
+    EXIF_MIN_SIZE = 1024
+    
+    # Seconds one exiftool run (one folder) may take before dates are read file by file
+    EXIFTOOL_TIMEOUT = 600
+    
+    # Directory names that are never scanned (matched case-insensitively)
+    SKIP_DIRECTORIES = [
+        # Windows system folders
+        'windows', 'program files', 'program files (x86)',
+        'programdata', '$recycle.bin', 'system volume information',
+        'recovery', 'perflogs', 'boot', 'appdata',
+        # Game launchers and stores
+        'steam', 'steamapps', 'steamlibrary', 'epic games', 'epicgames',
+        'origin games', 'ea games', 'ubisoft', 'ubisoft game launcher',
+        'gog games', 'gog galaxy', 'xbox games', 'riot games',
+        'battle.net', 'blizzard', 'bethesda',
+        # Common game install locations
+        'games', 'my games',
+        # Development and software
+        'node_modules', '.git', 'vendor', '.venv', 'venv',
+        # Other programs
+        'microsoft', 'adobe', 'nvidia', 'intel'
+    ]
+    
+    # GetDriveTypeW results worth scanning: removable, fixed, RAM disk
+    SCANNED_DRIVE_TYPES = {2, 3, 6}
+    
+    # How many moved files between progress log messages
+    PROGRESS_INTERVAL = 1000
+    
+    # How many console lines to collect before writing them to stdout at once
+    STDOUT_BATCH_LINES = 64
+    
+    # Concurrent copy + delete moves when source and destination volumes differ
+    CROSS_VOLUME_MOVE_WORKERS = 4
+    
+    # Threads hashing files in find_duplicates; hashlib and xxhash release
+    # the GIL while hashing, so threads scale until the disk is saturated
+    HASH_WORKERS = min(8, os.cpu_count() or 1)
+    
+    # Bytes read per call when hashing a file
+    HASH_CHUNK_SIZE = 1 << 20
+    
+    # Formats Pillow can decode for perceptual hashing
+    PHASH_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.ico')
+    
+    # Most pHash bits two images may differ by and still count as the same picture
+    PHASH_MAX_DISTANCE = 3
+    
+    # Worker processes computing perceptual hashes (ProcessPoolExecutor
+    # refuses more than 61 on Windows)
+    PHASH_WORKERS = min(61, os.cpu_count() or 1)
+    
+    # Most file data read ahead for the pHash workers on a hard disk at once
+    PHASH_READAHEAD_BYTES = 64 << 20
+    
+    # Side of the square blocks the pHash distance matrix is computed in with numpy
+    HAMMING_TILE = 1024
+    
+    # Bytes hashed from the start of same-size files before hashing them in full
+    HEAD_HASH_SIZE = 4096
+    
+    # Sidecar database of file hashes, so unchanged files aren't re-read on later runs
+    HASH_CACHE_FILE = (Path(os.environ.get('LOCALAPPDATA') or Path.home() / '.cache')
+                       / 'image_organizer' / 'hashes.sqlite')
+    # Cache rows not used for this many days (deleted or long-changed files) are dropped
+    HASH_CACHE_MAX_AGE_DAYS = 90
+    
+    # Same extensions as a tuple, so one C-level str.endswith call can test a filename
+    IMAGE_EXTENSIONS_TUPLE = tuple(IMAGE_EXTENSIONS)
+    
     def __init__(self, destination_folder_name="Photos to Clean", custom_exclusions=None, rename_by_date=False):
         """
         Initialize the organizer.
@@ -46,7 +208,36 @@ class DesktopImageOrganizer:
         self.destination_path = self.desktop_path / destination_folder_name
         self.custom_exclusions = [exc.lower() for exc in (custom_exclusions or [])]
         self.rename_by_date = rename_by_date
+        # Suffix numbers for resolving filename conflicts when moving
+        self._conflict_counter = itertools.count(1)
+        
+        # Precompute the skip checks once. Both the scanner and
+        # should_skip_path test directory names against one frozenset, so
+        # there is a single set lookup per name instead of a pattern match
+        self._dest_prefix_lower = str(self.destination_path).lower()
+        self._skip_names = frozenset(
+            # Destination folder (secondary protection - by folder name)
+            [self.destination_folder_name.lower()]
+            + self.SKIP_DIRECTORIES
+            + self.custom_exclusions
+        )
+        
+        # Messages logged before the log file is opened; once it is open,
+        # entries are streamed straight to it instead of kept in memory
         self.log_messages = []
+        self._log_fh = None
+        # Last whole second a log timestamp was formatted for, and its text
+        self._last_ts_sec = None
+        self._last_ts = ""
+        # Console lines waiting to be written; print() per line takes the
+        # stdout lock and flushes every time, which adds up on big scans
+        self._stdout = sys.stdout
+        self._stdout_buf = []
+        # Guards the log and stats, which are shared with scanner threads
+        self._lock = threading.Lock()
+        # EXIF dates read ahead by prefetch_exif_dates, keyed by normalized path
+        # (None = exiftool found no date in that file)
+        self._batch_exif_dates = {}
         self.stats = {
             'total_found': 0,
             'total_moved': 0,
@@ -59,18 +250,87 @@ class DesktopImageOrganizer:
     
     def log(self, message):
         """Log a message with timestamp."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        print(log_entry)
-        self.log_messages.append(log_entry)
+        sec = int(time.time())
+        with self._lock:
+            # Formatting the timestamp is costly; redo it only when the second changes
+            new_second = sec != self._last_ts_sec
+            if new_second:
+                self._last_ts_sec = sec
+                self._last_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            log_entry = f"[{self._last_ts}] {message}"
+            self._stdout_buf.append(log_entry + '\n')
+            # Write in batches, and whenever a new second starts. Nothing runs
+            # on a timer, so callers flush_output() before long silent work.
+            if new_second or len(self._stdout_buf) >= self.STDOUT_BATCH_LINES:
+                self._write_stdout_buf()
+            if self._log_fh is not None:
+                try:
+                    self._log_fh.write(log_entry + '\n')
+                    return
+                except (OSError, ValueError) as e:
+                    # Disk full or file gone: keep logging in memory rather
+                    # than fail the caller, which may be a scan or move thread
+                    self._stdout_buf.append(f"Log file write failed, keeping log in memory: {e}\n")
+                    self._write_stdout_buf()
+                    log_fh, self._log_fh = self._log_fh, None
+                    try:
+                        log_fh.close()
+                    except (OSError, ValueError):
+                        pass
+            self.log_messages.append(log_entry)
+    
+    def console(self, message):
+        """
+        Print a message without logging it.
+        
+        It goes through the same buffer as log(), so it cannot overtake log
+        lines that are still waiting to be written.
+        """
+        with self._lock:
+            self._stdout_buf.append(f"{message}\n")
+            if len(self._stdout_buf) >= self.STDOUT_BATCH_LINES:
+                self._write_stdout_buf()
+    
+    def _write_stdout_buf(self):
+        """Write buffered console lines to stdout. Caller must hold self._lock."""
+        if self._stdout_buf:
+            self._stdout.write(''.join(self._stdout_buf))
+            self._stdout_buf.clear()
+            self._stdout.flush()
+    
+    def flush_output(self):
+        """Write any buffered log lines to the console."""
+        with self._lock:
+            self._write_stdout_buf()
     
     def get_available_drives(self):
         """
         Get all available drive letters on Windows.
         
+        Only local fixed, removable and RAM drives are returned; CD/DVD and
+        network drives are left out.
+        
         Returns:
             list: List of available drive paths (e.g., ['C:\\', 'D:\\'])
         """
+        # One GetLogicalDrives call returns every drive letter as a bitmask,
+        # instead of probing all 26 letters with os.path.exists
+        try:
+            kernel32 = ctypes.windll.kernel32
+            bitmask = kernel32.GetLogicalDrives()
+            if bitmask:
+                drives = []
+                for i, letter in enumerate(string.ascii_uppercase):
+                    drive_path = f"{letter}:\\"
+                    # Skip optical, network and unknown drives - scanning them can
+                    # block for seconds (spin-up, timeouts) and they rarely hold photos
+                    if (bitmask & (1 << i)
+                            and kernel32.GetDriveTypeW(drive_path) in self.SCANNED_DRIVE_TYPES):
+                        drives.append(drive_path)
+                return drives
+        except (AttributeError, OSError):
+            pass  # Not on Windows (no ctypes.windll) - fall back to probing
+        
         drives = []
         for letter in string.ascii_uppercase:
             drive_path = f"{letter}:\\"
@@ -78,97 +338,270 @@ class DesktopImageOrganizer:
                 drives.append(drive_path)
         return drives
     
+    def is_rotational_drive(self, path):
+        """
+        Check whether a path is on a spinning hard disk.
+        
+        Parallel reads make a hard disk seek back and forth between files,
+        which is slower than reading them one at a time; SSDs don't mind.
+        
+        Args:
+            path: Any path on the drive to check
+            
+        Returns:
+            bool: True if the drive has a seek penalty (False if unknown)
+        """
+        path = os.path.abspath(path)
+        if os.name == 'nt':
+            try:
+                return self._windows_seek_penalty(os.path.splitdrive(path)[0])
+            except (AttributeError, OSError):
+                return False
+        
+        # Linux exposes the flag per block device in sysfs
+        try:
+            st_dev = os.stat(path).st_dev
+            device = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+            for folder in (device, os.path.dirname(device)):  # Partition, then whole disk
+                flag_file = os.path.join(folder, 'queue', 'rotational')
+                if os.path.exists(flag_file):
+                    with open(flag_file) as f:
+                        return f.read().strip() == '1'
+        except (AttributeError, OSError):
+            pass
+        return False
+    
+    def _windows_seek_penalty(self, drive):
+        """Ask Windows whether a volume (e.g. 'C:') incurs a seek penalty."""
+        from ctypes import wintypes
+        
+        class STORAGE_PROPERTY_QUERY(ctypes.Structure):
+            _fields_ = [('PropertyId', ctypes.c_int), ('QueryType', ctypes.c_int),
+                        ('AdditionalParameters', ctypes.c_ubyte * 1)]
+        
+        class DEVICE_SEEK_PENALTY_DESCRIPTOR(ctypes.Structure):
+            _fields_ = [('Version', wintypes.DWORD), ('Size', wintypes.DWORD),
+                        ('IncursSeekPenalty', wintypes.BOOLEAN)]
+        
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        # No access rights are needed just to query device properties
+        handle = kernel32.CreateFileW(f"\\\\.\\{drive}", 0, 3, None, 3, 0, None)  # share read/write, OPEN_EXISTING
+        if handle in (None, wintypes.HANDLE(-1).value):
+            return False
+        try:
+            query = STORAGE_PROPERTY_QUERY(7, 0)  # StorageDeviceSeekPenaltyProperty, PropertyStandardQuery
+            result = DEVICE_SEEK_PENALTY_DESCRIPTOR()
+            returned = wintypes.DWORD()
+            ok = kernel32.DeviceIoControl(
+                wintypes.HANDLE(handle), 0x2D1400,  # IOCTL_STORAGE_QUERY_PROPERTY
+                ctypes.byref(query), ctypes.sizeof(query),
+                ctypes.byref(result), ctypes.sizeof(result),
+                ctypes.byref(returned), None
+            )
+            return bool(ok and result.IncursSeekPenalty)
+        finally:
+            kernel32.CloseHandle(wintypes.HANDLE(handle))
+    
     def is_image_file(self, file_path):
         """
         Check if a file is an image based on its extension.
         
         Args:
-            file_path: Path to the file
+            file_path: Path to the file (str or Path)
             
         Returns:
             bool: True if file is an image
         """
-        return file_path.suffix.lower() in self.IMAGE_EXTENSIONS
+        return os.path.basename(file_path).lower().endswith(self.IMAGE_EXTENSIONS_TUPLE)
     
     def should_skip_path(self, path):
         """
         Determine if a path should be skipped during scanning.
         
         Args:
-            path: Path to check
+            path: Path to check - a str (as passed by the scanner) or a Path
             
         Returns:
             bool: True if path should be skipped
         """
-        path_str = str(path).lower()
+        # Scanner paths are already strings; only convert Path objects
+        path_str = path if isinstance(path, str) else os.fspath(path)
+        path_lower = path_str.lower()
         
         # Skip if already in destination folder (primary protection)
-        if str(self.destination_path).lower() in path_str:
+        if path_lower.startswith(self._dest_prefix_lower):
             return True
         
-        # Skip system, program, and game directories
-        skip_dirs = [
-            # Destination folder (secondary protection - by folder name)
-            self.destination_folder_name.lower(),
-            # Windows system folders
-            'windows', 'program files', 'program files (x86)',
-            'programdata', '$recycle.bin', 'system volume information',
-            'recovery', 'perflogs', 'boot', 'appdata',
-            # Game launchers and stores
-            'steam', 'steamapps', 'steamlibrary', 'epic games', 'epicgames',
-            'origin games', 'ea games', 'ubisoft', 'ubisoft game launcher',
-            'gog games', 'gog galaxy', 'xbox games', 'riot games',
-            'battle.net', 'blizzard', 'bethesda',
-            # Common game install locations
-            'games', 'my games',
-            # Development and software
-            'node_modules', '.git', 'vendor', '.venv', 'venv',
-            # Other programs
-            'microsoft', 'adobe', 'nvidia', 'intel'
-        ]
-        
-        # Add user's custom exclusions
-        all_skip_dirs = skip_dirs + self.custom_exclusions
-        
-        for skip_dir in all_skip_dirs:
-            if f'\\{skip_dir}\\' in path_str or path_str.endswith(f'\\{skip_dir}'):
-                return True
+        # Skip system, program, game, and user-excluded directories
+        return not self._skip_names.isdisjoint(re.split(r'[\\/]', path_lower))
+    
+    def _scandir_images(self, path, min_size=0):
+        """
+        Yield image file paths below a directory using os.scandir.
         
-        return False
+        DirEntry caches the file type from the directory listing, so no
+        extra stat() call or Path object is needed per entry. On Windows the
+        listing also carries the file size, so DirEntry.stat() is free there.
+        
+        Args:
+            path: Directory to scan
+            min_size: Skip images smaller than this many bytes (0 = keep all)
+            
+        Yields:
+            str: Full path of each image file found
+        """
+        # Bind hot lookups to locals once - the loop below runs for every
+        # entry on the drive. An explicit stack replaces recursion so each
+        # result is yielded directly instead of through one generator per level.
+        scandir = os.scandir
+        skip_names = self._skip_names
+        dest_lower = self._dest_prefix_lower
+        dest_len = len(dest_lower)
+        image_exts = self.IMAGE_EXTENSIONS_TUPLE
+        pending = [path]
+        pop = pending.pop
+        push = pending.append
+        
+        while pending:
+            try:
+                with scandir(pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Same rules as should_skip_path, applied incrementally
+                            if entry.name.lower() in skip_names:
+                                continue
+                            entry_path = entry.path
+                            if len(entry_path) == dest_len and entry_path.lower() == dest_lower:
+                                continue  # The destination folder itself
+                            push(entry_path)
+                        elif entry.is_file(follow_symlinks=False):
+                            # Inline extension check - this runs once per file on the drive
+                            if not entry.name.lower().endswith(image_exts):
+                                continue
+                            if min_size:
+                                # Tiny files are mostly thumbnail caches and icons
+                                try:
+                                    if entry.stat(follow_symlinks=False).st_size < min_size:
+                                        continue
+                                except OSError:
+                                    continue
+                            yield entry.path
+            except OSError:
+                pass  # Skip directories we can't read (permission denied, vanished, etc.)
+    
+    def _scandir_image_entries(self, path):
+        """
+        Yield a DirEntry for every image file below a directory, with no skip rules.
+        
+        Used for the destination folder, which should_skip_path would skip
+        entirely. DirEntry keeps the cached file type (and on Windows the
+        size), so callers can stat() without another system call.
+        
+        Args:
+            path: Directory to scan
+            
+        Yields:
+            os.DirEntry: Entry for each image file found
+        """
+        image_exts = self.IMAGE_EXTENSIONS_TUPLE
+        pending = [path]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif (entry.is_file(follow_symlinks=False)
+                              and entry.name.lower().endswith(image_exts)):
+                            yield entry
+            except OSError:
+                pass  # Skip directories we can't read
+    
+    def _comparable_size(self, entry, seen_links):
+        """
+        Return a scanned file's size, or None if it shouldn't be compared.
+        
+        Empty files have no content to match and nothing to reclaim. A file
+        with several hard links is only counted under the first name seen,
+        since removing another name for the same data frees no space.
+        
+        Args:
+            entry: os.DirEntry from _scandir_image_entries
+            seen_links: Set of (device, inode) pairs already counted; updated
+            
+        Returns:
+            int: Size in bytes, or None to skip the file
+        """
+        try:
+            st = entry.stat()
+            if not st.st_size:
+                return None
+            # Windows' cached stat reports st_nlink as 0, so this only costs
+            # a call where links are actually reported
+            if st.st_nlink > 1:
+                link = (st.st_dev, entry.inode())
+                if link in seen_links:
+                    return None
+                seen_links.add(link)
+        except OSError:
+            return None  # Vanished or unreadable
+        return st.st_size
     
-    def find_images_on_drive(self, drive_path):
+    def walk_image_folders(self, path):
+        """
+        Walk a folder tree like os.walk, but list only image files.
+        
+        Uses os.scandir's cached entry types directly, so there is no extra
+        stat() per entry. Each folder is listed completely before it is
+        yielded, so callers may rename files in it while iterating.
+        
+        Args:
+            path: Top folder to walk
+            
+        Yields:
+            tuple: (folder path, subfolder names, image file names)
+        """
+        image_exts = self.IMAGE_EXTENSIONS_TUPLE
+        pending = [os.fspath(path)]
+        while pending:
+            root = pending.pop()
+            dirs = []
+            images = []
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.name)
+                        elif (entry.is_file(follow_symlinks=False)
+                              and entry.name.lower().endswith(image_exts)):
+                            images.append(entry.name)
+            except OSError:
+                continue  # Skip folders we can't read
+            yield root, dirs, images
+            pending.extend(os.path.join(root, d) for d in reversed(dirs))
+    
+    def find_images_on_drive(self, drive_path, min_size=0):
         """
         Recursively find all image files on a drive.
         
+        Images are yielded as soon as they are found, so callers can start
+        moving files while the rest of the drive is still being scanned.
+        
         Args:
             drive_path: Root path of the drive to scan
+            min_size: Skip images smaller than this many bytes (0 = keep all)
             
-        Returns:
-            list: List of Path objects for found images
+        Yields:
+            str: Path of each image found
         """
-        images = []
         self.log(f"Scanning drive: {drive_path}")
+        self.flush_output()
         
         try:
-            for root, dirs, files in os.walk(drive_path):
-                # Filter out directories to skip
-                dirs[:] = [d for d in dirs if not self.should_skip_path(Path(root) / d)]
-                
-                current_path = Path(root)
-                if self.should_skip_path(current_path):
-                    continue
-                
-                for file in files:
-                    file_path = current_path / file
-                    if self.is_image_file(file_path):
-                        images.append(file_path)
-                        
-        except PermissionError as e:
-            self.log(f"  Permission denied: {root}")
+            yield from self._scandir_images(drive_path, min_size)
         except Exception as e:
-            self.log(f"  Error scanning {root}: {str(e)}")
-        
-        return images
+            self.log(f"  Error scanning {drive_path}: {str(e)}")
     
     def create_destination_structure(self, drive_letter):
         """
@@ -194,8 +627,44 @@ class DesktopImageOrganizer:
         Returns:
             datetime: Date of the image, or None if not available
         """
-        # Try to get EXIF date taken (most accurate for photos)
-        if PIL_AVAILABLE:
+        try:
+            stat = image_path.stat()
+        except Exception:
+            return None
+        
+        suffix = image_path.suffix.lower()
+        has_exif = suffix in self.EXIF_EXTENSIONS and stat.st_size >= self.EXIF_MIN_SIZE
+        
+        # Use the date exiftool already read in batch, if this file was included
+        if has_exif and self._batch_exif_dates:
+            key = os.path.normcase(os.path.normpath(str(image_path)))
+            if key in self._batch_exif_dates:
+                batch_date = self._batch_exif_dates[key]
+                if batch_date is not None:
+                    return batch_date
+                has_exif = False
+        
+        # Try to get EXIF date taken (most accurate for photos). exifread reads
+        # only the file header and stops at the tag we need, without opening
+        # the image the way Pillow does.
+        if has_exif and EXIFREAD_AVAILABLE:
+            try:
+                with open(image_path, 'rb') as f:
+                    # stop_tag is the bare tag name; the result key has the IFD prefix
+                    tags = exifread.process_file(f, details=False,
+                                                 stop_tag='DateTimeOriginal',
+                                                 extract_thumbnail=False)
+                value = tags.get('EXIF DateTimeOriginal')
+                if value:
+                    # EXIF date format: "YYYY:MM:DD HH:MM:SS"
+                    return datetime.strptime(str(value).strip(), "%Y:%m:%d %H:%M:%S")
+            except Exception:
+                pass  # Fall back to Pillow or file dates
+            # exifread fully handles JPEG; other formats may still be readable by Pillow
+            if suffix in ('.jpg', '.jpeg'):
+                has_exif = False
+        
+        if has_exif and PIL_AVAILABLE:
             try:
                 img = Image.open(image_path)
                 exif_data = img._getexif()
@@ -210,10 +679,8 @@ class DesktopImageOrganizer:
             except Exception:
                 pass  # If EXIF reading fails, fall back to file dates
         
-        # Fall back to file creation/modification date
+        # Fall back to file creation/modification date (stat taken above)
         try:
-            # Use creation time on Windows, modification time as fallback
-            stat = image_path.stat()
             # Try creation time first (st_ctime on Windows is creation time)
             if hasattr(stat, 'st_birthtime'):
                 return datetime.fromtimestamp(stat.st_birthtime)
@@ -223,6 +690,46 @@ class DesktopImageOrganizer:
         except Exception:
             return None
     
+    def prefetch_exif_dates(self, image_paths):
+        """
+        Read EXIF dates for many files with a single exiftool run.
+        
+        get_image_date then uses these dates instead of parsing each file.
+        Replaces any dates prefetched earlier. Does nothing if exiftool is
+        not installed.
+        
+        Args:
+            image_paths: Paths (str) of the images about to be dated
+        """
+        self._batch_exif_dates = {}
+        paths = [p for p in image_paths if os.path.splitext(p)[1].lower() in self.EXIF_EXTENSIONS]
+        if EXIFTOOL is None or not paths:
+            return
+        
+        try:
+            result = subprocess.run(
+                [EXIFTOOL, '-json', '-charset', 'filename=utf8', '-DateTimeOriginal',
+                 '-d', '%Y:%m:%d %H:%M:%S', '-@', '-'],
+                input='\n'.join(paths).encode('utf-8'),
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                timeout=self.EXIFTOOL_TIMEOUT
+            )
+            # exiftool exits non-zero if any file failed but still reports the rest
+            records = json.loads(result.stdout.decode('utf-8') or '[]')
+        except (OSError, ValueError, subprocess.SubprocessError) as e:
+            self.log(f"  exiftool failed, reading dates file by file: {str(e)}")
+            return
+        
+        for record in records:
+            source = record.get('SourceFile')
+            if not source:
+                continue
+            try:
+                date = datetime.strptime(str(record['DateTimeOriginal']), "%Y:%m:%d %H:%M:%S")
+            except (KeyError, ValueError):
+                date = None
+            self._batch_exif_dates[os.path.normcase(os.path.normpath(source))] = date
+    
     def generate_dated_filename(self, source_path):
         """
         Generate a filename with date prefix for chronological sorting.
@@ -249,50 +756,235 @@ class DesktopImageOrganizer:
             date_prefix = datetime.now().strftime("%Y%m%d")
             return f"{date_prefix}_{filename}"
     
-    def move_image(self, source_path, destination_folder):
+    def _move_no_replace(self, src, dst):
+        """
+        Move a file, never overwriting an existing destination file.
+        
+        Same-volume moves are a single rename call; only moves across
+        volumes fall back to copy + delete.
+        
+        Args:
+            src: Source file path (str)
+            dst: Destination file path (str)
+            
+        Raises:
+            FileExistsError: If dst already exists
+        """
+        try:
+            if os.name == 'nt':
+                # Windows rename refuses to replace an existing file
+                os.rename(src, dst)
+                return
+            
+            # POSIX rename silently replaces, but link fails if dst exists
+            try:
+                os.link(src, dst)
+            except FileExistsError:
+                raise
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    raise
+                # Filesystem without hard links - check, then rename
+                if os.path.lexists(dst):
+                    raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+                os.rename(src, dst)
+            else:
+                try:
+                    os.unlink(src)
+                except BaseException:
+                    # Source can't be removed - drop the new link rather
+                    # than leave the file in both places
+                    try:
+                        os.unlink(dst)
+                    except OSError:
+                        pass
+                    raise
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Different volume: rename is impossible, copy + delete instead.
+            # Claim the name with an exclusive create first so concurrent
+            # movers can't pick the same one, then copy over the placeholder.
+            fd = os.open(dst, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            try:
+                self._copy_across_volumes(src, dst)
+            except BaseException:
+                try:
+                    os.unlink(dst)
+                except OSError:
+                    pass
+                raise
+    
+    def _copy_across_volumes(self, src, dst):
+        """
+        Move a file to another volume by copying it and deleting the original.
+        
+        On Windows the copy is a single CopyFileExW call, which copies inside
+        the OS (with timestamps and attributes) instead of reading the data
+        through Python. Elsewhere shutil.move already uses sendfile where
+        the platform has it.
+        
+        Args:
+            src: Source file path (str)
+            dst: Destination file path (str); an existing file is overwritten
+        """
+        if os.name == 'nt':
+            try:
+                copied = ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0)
+            except (AttributeError, OSError):
+                copied = 0
+            if copied:
+                os.unlink(src)
+                return
+        shutil.move(src, dst)
+    
+    def move_unique(self, src, dest_folder_str, filename):
+        """
+        Move a file into a folder, adding a counter suffix if the name is taken.
+        
+        Args:
+            src: Source file path (str)
+            dest_folder_str: Destination folder path as a string ending in a
+                path separator, so filenames can be appended directly
+            filename: Preferred name for the file in that folder
+            
+        Returns:
+            str: The path the file ended up at (src if it already had that name)
+        """
+        # Try the plain name first - no existence pre-check in the common case
+        destination_file = dest_folder_str + filename
+        if os.path.normcase(destination_file) == os.path.normcase(src):
+            return src  # Already has this name; a move would only collide with itself
+        try:
+            self._move_no_replace(src, destination_file)
+        except FileExistsError:
+            # Name taken - add a counter suffix, retrying until the move succeeds.
+            # Unlike a timestamp, this can't repeat for burst photos in the same second.
+            stem, suffix = os.path.splitext(filename)
+            while True:
+                destination_file = f"{dest_folder_str}{stem}_{next(self._conflict_counter)}{suffix}"
+                try:
+                    self._move_no_replace(src, destination_file)
+                    break
+                except FileExistsError:
+                    continue
+        return destination_file
+    
+    def move_image(self, source_path, dest_folder_str):
         """
         Move an image file to the destination folder.
         
         Args:
-            source_path: Source path of the image
-            destination_folder: Destination folder path
+            source_path: Source path of the image (str or Path)
+            dest_folder_str: Destination folder path as a string ending in a
+                path separator, so filenames can be appended directly
             
         Returns:
             bool: True if successfully moved
         """
+        # Scanner paths are already strings; only convert Path objects
+        src = source_path if isinstance(source_path, str) else os.fspath(source_path)
         try:
             # Determine the destination filename
             if self.rename_by_date:
-                new_filename = self.generate_dated_filename(source_path)
+                new_filename = self.generate_dated_filename(Path(src))
             else:
-                new_filename = source_path.name
-            
-            # Handle filename conflicts
-            destination_file = destination_folder / new_filename
-            if destination_file.exists():
-                # Add extra timestamp to filename if conflict exists
-                stem = Path(new_filename).stem
-                suffix = Path(new_filename).suffix
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S%f")  # Added microseconds for uniqueness
-                destination_file = destination_folder / f"{stem}_{timestamp}{suffix}"
-            
-            shutil.move(str(source_path), str(destination_file))
+                new_filename = os.path.basename(src)
+            
+            self.move_unique(src, dest_folder_str, new_filename)
             return True
             
         except PermissionError:
-            self.log(f"  Permission denied: {source_path}")
+            self.log(f"  Permission denied: {src}")
             return False
         except Exception as e:
-            self.log(f"  Error moving {source_path}: {str(e)}")
+            self.log(f"  Error moving {src}: {str(e)}")
             return False
     
-    def organize_images(self, drives=None, dry_run=False):
+    def _move_and_record(self, image_path, dest_folder_str, drive_letter):
+        """
+        Move one image and update the stats; safe to call from worker threads.
+        
+        Args:
+            image_path: Source path of the image
+            dest_folder_str: Destination folder string ending in a separator
+            drive_letter: Drive the image was found on, for per-drive stats
+        """
+        if self.move_image(image_path, dest_folder_str):
+            with self._lock:
+                self.stats['total_moved'] += 1
+                self.stats['by_drive'][drive_letter]['moved'] += 1
+                moved = self.stats['by_drive'][drive_letter]['moved']
+            if moved % self.PROGRESS_INTERVAL == 0:
+                self.log(f"  Progress: {moved} images moved from Drive {drive_letter}")
+                self.flush_output()
+        else:
+            with self._lock:
+                self.stats['total_errors'] += 1
+    
+    def _process_drive(self, drive, dry_run, dry_run_fh, mover, mover_slots, min_size):
+        """
+        Scan one drive, moving (or in a dry run, listing) images as they are found.
+        
+        Args:
+            drive: Root path of the drive to scan
+            dry_run: If True, only list the images that would be moved
+            dry_run_fh: Open file for the dry run listing, or None
+            mover: Thread pool for cross-volume moves (None in a dry run)
+            mover_slots: Semaphore bounding how many moves wait in the pool
+            min_size: Skip images smaller than this many bytes (0 = keep all)
+        """
+        drive_letter = drive[0]  # Extract letter (e.g., 'C' from 'C:\\')
+        drive_folder_str = None
+        found = 0
+        
+        for image_path in self.find_images_on_drive(drive, min_size):
+            found += 1
+            
+            if dry_run:
+                if dry_run_fh is not None:
+                    with self._lock:
+                        dry_run_fh.write(image_path + '\n')
+                continue
+            
+            # Create the drive subfolder on the first image, so drives
+            # without images don't leave empty folders behind
+            if drive_folder_str is None:
+                drive_folder = self.create_destination_structure(drive_letter)
+                self.log(f"Destination for Drive {drive_letter}: {drive_folder}")
+                # Cached once per drive; move_image appends filenames to it
+                drive_folder_str = os.path.join(str(drive_folder), '')
+                dest_volume = os.path.splitdrive(drive_folder_str)[0].lower()
+            
+            # Same-volume moves are metadata-only renames and gain nothing from
+            # threads; cross-volume moves copy file data, so overlap several
+            if os.path.splitdrive(image_path)[0].lower() == dest_volume:
+                self._move_and_record(image_path, drive_folder_str, drive_letter)
+            else:
+                mover_slots.acquire()
+                future = mover.submit(self._move_and_record, image_path,
+                                      drive_folder_str, drive_letter)
+                future.add_done_callback(lambda _: mover_slots.release())
+        
+        with self._lock:
+            self.stats['total_found'] += found
+            self.stats['by_drive'][drive_letter]['found'] = found
+        
+        if dry_run:
+            self.log(f"Would move {found} image(s) from Drive {drive_letter}")
+        else:
+            self.log(f"Finished scanning Drive {drive_letter}: {found} image(s) found")
+    
+    def organize_images(self, drives=None, dry_run=False, min_size=0):
         """
         Main method to organize images across drives.
         
         Args:
             drives: List of drive paths to scan (None = all drives)
             dry_run: If True, only report what would be done without moving files
+            min_size: Skip images smaller than this many bytes, e.g. 1024 to
+                leave tiny thumbnail-cache files alone (0 = move all images)
         """
         self.log("=" * 70)
         self.log("Desktop Image Organizer Started")
@@ -306,54 +998,61 @@ class DesktopImageOrganizer:
             drives = self.get_available_drives()
         
         self.log(f"Drives to scan: {', '.join(drives)}")
+        if min_size:
+            self.log(f"Skipping images smaller than {self.format_size(min_size)}")
         self.log("")
         
-        # Create main destination folder
+        # Create main destination folder and start streaming the log into it
         if not dry_run:
             self.destination_path.mkdir(parents=True, exist_ok=True)
+            try:
+                self.open_log_file()
+            except Exception as e:
+                # Not worth aborting the run over; save_log tries again at the end
+                self.log(f"Could not open log file, keeping log in memory: {str(e)}")
             self.log(f"Destination folder created: {self.destination_path}")
         
-        # Process each drive
+        # In a dry run, list every file in a plain text file instead of logging
+        # one line per image, which dominates run time on large drives
+        dry_run_fh = None
+        if dry_run:
+            dry_run_file = self.desktop_path / f"dry_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            try:
+                dry_run_fh = open(dry_run_file, 'w', encoding='utf-8', buffering=1 << 16)
+                self.log(f"Files that would be moved are listed in: {dry_run_file}")
+            except OSError as e:
+                self.log(f"Could not create dry run file list: {str(e)}")
+        
+        # Pre-fill per-drive stats so the summary keeps the original drive order
         for drive in drives:
-            drive_letter = drive[0]  # Extract letter (e.g., 'C' from 'C:\\')
-            
-            self.log("")
-            self.log(f"Processing Drive {drive_letter}:")
-            self.log("-" * 70)
-            
-            # Find images
-            images = self.find_images_on_drive(drive)
-            self.stats['total_found'] += len(images)
-            self.stats['by_drive'][drive_letter] = {'found': len(images), 'moved': 0}
-            
-            self.log(f"Found {len(images)} image(s) on Drive {drive_letter}")
-            
-            if not images:
-                continue
-            
-            # Create drive subfolder
-            if not dry_run:
-                drive_folder = self.create_destination_structure(drive_letter)
-                self.log(f"Destination: {drive_folder}")
-            
-            # Move images
-            self.log("Moving images...")
-            for i, image_path in enumerate(images, 1):
-                if dry_run:
-                    self.log(f"  [{i}/{len(images)}] Would move: {image_path}")
-                else:
-                    if self.move_image(image_path, drive_folder):
-                        self.stats['total_moved'] += 1
-                        self.stats['by_drive'][drive_letter]['moved'] += 1
-                        if i % 10 == 0 or i == len(images):
-                            self.log(f"  Progress: {i}/{len(images)} images moved")
-                    else:
-                        self.stats['total_errors'] += 1
+            self.stats['by_drive'][drive[0]] = {'found': 0, 'moved': 0}
+        
+        # Cross-volume moves are shared by all drives; the semaphore keeps the
+        # pool's queue short so memory stays flat however many images are found
+        mover = None if dry_run else ThreadPoolExecutor(max_workers=self.CROSS_VOLUME_MOVE_WORKERS)
+        mover_slots = threading.BoundedSemaphore(self.CROSS_VOLUME_MOVE_WORKERS * 4)
+        
+        self.flush_output()
+        try:
+            # Scan drives concurrently - separate drives are usually separate
+            # physical devices, and the GIL is released while waiting on the disk.
+            # Each drive moves its images while it is still being scanned.
+            with ThreadPoolExecutor(max_workers=max(1, len(drives))) as executor:
+                futures = [executor.submit(self._process_drive, drive, dry_run,
+                                           dry_run_fh, mover, mover_slots, min_size)
+                           for drive in drives]
+                for future in as_completed(futures):
+                    future.result()
+        finally:
+            if mover is not None:
+                mover.shutdown(wait=True)
+            if dry_run_fh is not None:
+                dry_run_fh.close()
         
         # Print summary
         self.print_summary(dry_run)
         
-        # Save log file
+        # Flush and close the streamed log file
         if not dry_run:
             self.save_log()
     
@@ -378,80 +1077,540 @@ class DesktopImageOrganizer:
                 self.log(f"  Drive {drive}: {stats['moved']}/{stats['found']} moved")
         
         self.log("=" * 70)
+        self.flush_output()
     
     def calculate_file_hash(self, file_path):
         """
-        Calculate MD5 hash of a file for duplicate detection.
+        Calculate a content hash of a file for duplicate detection.
+        
+        Uses xxHash (XXH3, 128-bit) when the xxhash package is installed -
+        duplicate detection needs no cryptographic strength, and XXH3 is many
+        times faster than MD5 - and falls back to MD5 otherwise.
         
         Args:
             file_path: Path to the file
             
         Returns:
-            str: MD5 hash of the file
+            str: Hex digest of the file contents
+        """
+        digest = self._file_digest(file_path)
+        return digest.hex() if digest is not None else None
+    
+    def _file_digest(self, file_path):
         """
-        hash_md5 = hashlib.md5()
+        Hash a file's contents, returning the raw digest bytes.
+        
+        find_duplicates keys its table on these directly; 16 raw bytes are
+        half the size of the hex string and cheaper to hash and compare.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            bytes: Digest of the file contents, or None if it can't be read
+        """
+        hasher = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.md5()
         try:
-            with open(file_path, "rb") as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            # Unbuffered - the large reads below make Python's own buffer a wasted copy
+            with open(file_path, "rb", buffering=0) as f:
+                # Read 1 MiB chunks into one reused buffer, so there is no new
+                # bytes object per chunk. Not mmap: a read error on a mapped
+                # file (a OneDrive placeholder failing to download, a dropped
+                # network or USB drive) kills the process instead of raising.
+                buf = bytearray(self.HASH_CHUNK_SIZE)
+                view = memoryview(buf)
+                readinto = f.readinto
+                while True:
+                    n = readinto(buf)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+            return hasher.digest()
         except Exception as e:
             self.log(f"  Error hashing {file_path}: {str(e)}")
             return None
     
+    def _file_head_digest(self, file_path):
+        """
+        Hash only the first HEAD_HASH_SIZE bytes of a file.
+        
+        For files no larger than that this equals _file_digest, since the
+        same hash function is used.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            bytes: Digest of the file's first bytes, or None if it can't be read
+        """
+        hasher = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.md5()
+        try:
+            with open(file_path, "rb", buffering=0) as f:
+                hasher.update(f.read(self.HEAD_HASH_SIZE))
+            return hasher.digest()
+        except Exception as e:
+            self.log(f"  Error hashing {file_path}: {str(e)}")
+            return None
+    
+    def _open_hash_cache(self):
+        """
+        Open the sidecar hash cache, creating it if needed.
+        
+        Returns:
+            sqlite3.Connection: Open cache, or None if it can't be used
+        """
+        try:
+            self.HASH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.HASH_CACHE_FILE))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Caches from before the device number was part of the key are
+            # dropped rather than migrated; they only hold recomputable hashes
+            if conn.execute("PRAGMA user_version").fetchone()[0] < 2:
+                conn.execute("DROP TABLE IF EXISTS hashes")
+                conn.execute("PRAGMA user_version=2")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                " dev INTEGER, ino INTEGER, mtime_ns INTEGER, size INTEGER, kind TEXT,"
+                " digest BLOB, last_used INTEGER,"
+                " PRIMARY KEY (dev, ino, mtime_ns, size, kind)) WITHOUT ROWID"
+            )
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            self.log(f"  Hash cache unavailable, hashing every file: {str(e)}")
+            return None
+    
+    def _hash_cache_key(self, entry):
+        """
+        Build the cache key for a scanned file: (device, inode, mtime_ns, size).
+        
+        The inode survives renames and moves within the folder, and any edit
+        changes the modification time or size, so a key hit means unchanged data.
+        Inode numbers are only unique on one volume, hence the device number.
+        
+        Args:
+            entry: os.DirEntry of the file
+            
+        Returns:
+            tuple: Cache key, or None if the filesystem reports no inode number
+        """
+        try:
+            st = entry.stat()
+            if not st.st_ino:
+                # Windows' cached stat has no inode or volume numbers; one
+                # full stat call gets both
+                st = os.stat(entry.path, follow_symlinks=False)
+        except OSError:
+            return None
+        if not st.st_ino:
+            return None
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _cached_hash(self, cache, key, kind):
+        """Look up a cached digest of the given kind; None on a miss."""
+        if cache is None or key is None:
+            return None
+        try:
+            row = cache.execute(
+                "SELECT digest FROM hashes"
+                " WHERE dev=? AND ino=? AND mtime_ns=? AND size=? AND kind=?",
+                key + (kind,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+    
+    def _store_hashes(self, cache, rows, used_keys):
+        """
+        Update the cache after a scan in a single transaction.
+        
+        Saves newly computed digests, marks reused ones as used today, and
+        drops rows unused for HASH_CACHE_MAX_AGE_DAYS, so entries for deleted
+        or edited files don't pile up.
+        
+        Args:
+            cache: Open cache connection
+            rows: (dev, ino, mtime_ns, size, kind, digest) tuples
+            used_keys: (dev, ino, mtime_ns, size, kind) tuples that were cache hits
+        """
+        today = int(time.time() // 86400)
+        try:
+            with cache:
+                cache.executemany(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [row + (today,) for row in rows]
+                )
+                cache.executemany(
+                    "UPDATE hashes SET last_used=?"
+                    " WHERE dev=? AND ino=? AND mtime_ns=? AND size=? AND kind=?",
+                    [(today,) + key for key in used_keys]
+                )
+                cache.execute("DELETE FROM hashes WHERE last_used < ?",
+                              (today - self.HASH_CACHE_MAX_AGE_DAYS,))
+        except sqlite3.Error as e:
+            self.log(f"  Could not update hash cache: {str(e)}")
+    
     def find_duplicates(self):
         """
         Find duplicate images in the destination folder.
         
         Returns:
-            dict: Dictionary mapping hash to list of file paths with that hash
+            dict: Dictionary mapping raw digest bytes to a list of
+                (Path, size in bytes) tuples for the files with that content.
+                Sizes come from the scan, so removal needs no further stat calls.
         """
         self.log("")
         self.log("=" * 70)
         self.log("SCANNING FOR DUPLICATES")
         self.log("=" * 70)
+        self.flush_output()
         
+        size_dict = defaultdict(list)
         hash_dict = defaultdict(list)
         file_count = 0
         
-        # Scan all files in destination folder
-        for root, dirs, files in os.walk(self.destination_path):
-            for file in files:
-                file_path = Path(root) / file
+        # First pass: group all images in destination folder by size (log
+        # files are skipped). Files with a unique size can't have a duplicate,
+        # so most of them never need to be read at all.
+        # Empty files and extra hard links to an already seen file are left
+        # out, as nothing would be freed by removing them.
+        seen_links = set()
+        skipped_count = 0
+        for entry in self._scandir_image_entries(self.destination_path):
+            size = self._comparable_size(entry, seen_links)
+            if size is None:
+                skipped_count += 1
+                continue
+            size_dict[size].append(entry)
+            file_count += 1
+            if file_count % 1000 == 0:
+                self.log(f"  Scanned {file_count} images...")
+                self.flush_output()
+        
+        # Second pass: hash only files whose size matches another file's.
+        # Hashes from earlier runs are reused for files that haven't changed.
+        hash_kind = 'xxh3_128' if XXHASH_AVAILABLE else 'md5'
+        cache = self._open_hash_cache()
+        head_jobs = []  # (path, size, key, cached) for buckets that need reading
+        used_keys = []
+        cached_count = 0
+        for size, entries in size_dict.items():
+            if len(entries) < 2:
+                continue
+            bucket = []
+            needs_hashing = False
+            for entry in entries:
+                key = self._hash_cache_key(entry)
+                file_hash = self._cached_hash(cache, key, hash_kind)
+                if file_hash:
+                    cached_count += 1
+                    used_keys.append(key + (hash_kind,))
+                    hash_dict[file_hash].append((entry.path, size))
+                else:
+                    needs_hashing = True
+                bucket.append((entry.path, size, key, bool(file_hash)))
+            if needs_hashing:
+                head_jobs.extend(bucket)
+        
+        # Read files several at a time - unless the folder is on a hard
+        # disk, where parallel reads only make it seek between files
+        rotational = bool(head_jobs) and self.is_rotational_drive(self.destination_path)
+        if rotational:
+            self.log("  Destination is on a hard disk - reading one file at a time")
+        hashed_count = 0
+        new_rows = []
+        with ThreadPoolExecutor(max_workers=1 if rotational else self.HASH_WORKERS) as executor:
+            # Third pass: hash just the first few KB. Same-size files almost
+            # always differ there already, so few need reading in full.
+            head_dict = defaultdict(list)
+            heads = executor.map(self._file_head_digest, [job[0] for job in head_jobs])
+            for job, head in zip(head_jobs, heads):
+                if head:
+                    head_dict[(job[1], head)].append(job)
+            
+            to_hash = []
+            for (size, head), jobs in head_dict.items():
+                for path, size, key, cached in jobs:
+                    if cached:
+                        continue
+                    if size <= self.HEAD_HASH_SIZE:
+                        # The head was the whole file, so it is the full digest
+                        hash_dict[head].append((path, size))
+                        if key is not None:
+                            new_rows.append(key + (hash_kind, head))
+                    elif len(jobs) > 1:
+                        to_hash.append((path, size, key))
+            
+            # Last pass: full hashes, only where size and head both match
+            digests = executor.map(self._file_digest, [path for path, _, _ in to_hash])
+            for (path, size, key), file_hash in zip(to_hash, digests):
+                hashed_count += 1
+                if hashed_count % 50 == 0:
+                    self.log(f"  Hashed {hashed_count} images...")
+                    self.flush_output()
                 
-                # Only process image files, skip log files
-                if self.is_image_file(file_path):
-                    file_count += 1
-                    if file_count % 50 == 0:
-                        self.log(f"  Scanned {file_count} images...")
-                    
-                    file_hash = self.calculate_file_hash(file_path)
-                    if file_hash:
-                        hash_dict[file_hash].append(file_path)
+                if file_hash:
+                    hash_dict[file_hash].append((path, size))
+                    if key is not None:
+                        new_rows.append(key + (hash_kind, file_hash))
+        
+        if cache is not None:
+            self._store_hashes(cache, new_rows, used_keys)
+            cache.close()
         
         # Filter to only duplicates (hash appears more than once)
-        duplicates = {h: paths for h, paths in hash_dict.items() if len(paths) > 1}
+        # Paths stay plain strings until here; only duplicates become Path objects
+        duplicates = {h: [(Path(p), size) for p, size in files]
+                      for h, files in hash_dict.items() if len(files) > 1}
         
         duplicate_count = sum(len(paths) - 1 for paths in duplicates.values())
         self.stats['duplicates_found'] = duplicate_count
         
-        self.log(f"Scanned {file_count} total images")
+        self.log(f"Scanned {file_count} total images ({hashed_count} with a matching size and "
+                 f"start were hashed in full, {cached_count} hashes reused from earlier runs)")
+        if skipped_count:
+            self.log(f"Skipped {skipped_count} empty, unreadable or hard-linked files")
         self.log(f"Found {len(duplicates)} unique images with duplicates")
         self.log(f"Total duplicate files: {duplicate_count}")
+        self.flush_output()
         
         return duplicates
     
-    def remove_duplicates(self, duplicates, dry_run=False):
+    def find_similar_images(self, max_distance=None):
+        """
+        Find visually similar images in the destination folder.
+        
+        Unlike find_duplicates this also matches resized or re-encoded
+        copies, by comparing perceptual hashes. Needs Pillow.
+        
+        Args:
+            max_distance: Most pHash bits two images may differ by
+                (None = PHASH_MAX_DISTANCE)
+            
+        Returns:
+            dict: Dictionary mapping a group's pHash to a list of
+                (Path, size in bytes) tuples, as find_duplicates does. The
+                largest file comes first, and every other file is within
+                max_distance bits of it.
+        """
+        if max_distance is None:
+            max_distance = self.PHASH_MAX_DISTANCE
+        
+        self.log("")
+        self.log("=" * 70)
+        self.log("SCANNING FOR SIMILAR IMAGES")
+        self.log("=" * 70)
+        
+        if not PIL_AVAILABLE:
+            self.log("Pillow is not installed - similar image detection is unavailable.")
+            self.flush_output()
+            return {}
+        self.flush_output()
+        
+        # Perceptual hashes are cached like content hashes; unchanged files are
+        # looked up instead of decoded again
+        cache = self._open_hash_cache()
+        files = []
+        hashes = []
+        to_hash = []
+        used_keys = []
+        seen_links = set()
+        for entry in self._scandir_image_entries(self.destination_path):
+            if not entry.name.lower().endswith(self.PHASH_EXTENSIONS):
+                continue
+            size = self._comparable_size(entry, seen_links)
+            if size is None:
+                continue
+            key = self._hash_cache_key(entry)
+            cached = self._cached_hash(cache, key, 'phash')
+            if cached:
+                used_keys.append(key + ('phash',))
+                files.append((entry.path, size))
+                hashes.append(int.from_bytes(cached, 'big'))
+            else:
+                to_hash.append((entry.path, size, key))
+        
+        # Decoding and the DCT are CPU-bound Python work, so spread them over
+        # processes; threads would just queue up on the GIL. On a hard disk
+        # this thread reads the files one by one and hands the workers bytes,
+        # so the CPU pool never turns into parallel disk reads.
+        rotational = bool(to_hash) and self.is_rotational_drive(self.destination_path)
+        if rotational:
+            self.log("  Destination is on a hard disk - reading one file at a time")
+        new_rows = []
+        hashed_count = 0
+        
+        def collect(item, future):
+            nonlocal hashed_count
+            path, size, key = item
+            hashed_count += 1
+            if hashed_count % 50 == 0:
+                self.log(f"  Hashed {hashed_count} images...")
+                self.flush_output()
+            phash = future.result()
+            if phash is None:
+                return  # Not decodable
+            files.append((path, size))
+            hashes.append(phash)
+            if key is not None:
+                new_rows.append(key + ('phash', phash.to_bytes(8, 'big')))
+        
+        if to_hash:
+            with ProcessPoolExecutor(max_workers=self.PHASH_WORKERS) as executor:
+                # Bounded window of in-flight work keeps memory flat: a few
+                # jobs per worker, and on a hard disk also a cap on the bytes
+                # read ahead, since each job then carries a whole file
+                pending = deque()
+                pending_bytes = 0
+                for item in to_hash:
+                    source = item[0]
+                    nbytes = 0
+                    if rotational:
+                        try:
+                            with open(source, 'rb') as f:
+                                source = f.read()
+                        except OSError:
+                            continue
+                        nbytes = len(source)
+                    pending.append((item, executor.submit(compute_phash, source), nbytes))
+                    pending_bytes += nbytes
+                    while pending and (len(pending) >= self.PHASH_WORKERS * 4
+                                       or pending_bytes > self.PHASH_READAHEAD_BYTES):
+                        done_item, future, nbytes = pending.popleft()
+                        pending_bytes -= nbytes
+                        collect(done_item, future)
+                while pending:
+                    done_item, future, _ = pending.popleft()
+                    collect(done_item, future)
+        
+        if cache is not None:
+            self._store_hashes(cache, new_rows, used_keys)
+            cache.close()
+        
+        # Group around keepers rather than taking connected sets: a chain of
+        # burst shots each a few bits from the next would otherwise collapse
+        # into one group whose ends look nothing alike. Files are visited in
+        # the order remove_duplicates(keep_largest=True) prefers them; each
+        # one not yet claimed keeps itself plus its unclaimed close matches,
+        # so every removal candidate is within max_distance of its keeper.
+        count = len(hashes)
+        neighbors = defaultdict(list)
+        for i, j in self._similar_pairs(hashes, max_distance):
+            neighbors[i].append(j)
+            neighbors[j].append(i)
+        
+        claimed = [False] * count
+        similar = {}
+        for i in sorted(neighbors, key=lambda i: (-files[i][1], Path(files[i][0]))):
+            if claimed[i]:
+                continue
+            claimed[i] = True
+            members = [i]
+            for j in neighbors[i]:
+                if not claimed[j]:
+                    claimed[j] = True
+                    members.append(j)
+            if len(members) > 1:
+                similar[hashes[i]] = [(Path(files[k][0]), files[k][1]) for k in members]
+        
+        duplicate_count = sum(len(members) - 1 for members in similar.values())
+        self.stats['duplicates_found'] = duplicate_count
+        
+        self.log(f"Compared {count} images ({len(new_rows)} newly hashed)")
+        self.log(f"Found {len(similar)} groups of similar images")
+        self.log(f"Total similar copies: {duplicate_count}")
+        self.flush_output()
+        
+        return similar
+    
+    def _similar_pairs(self, hashes, max_distance):
+        """
+        Yield every index pair (i, j), i < j, whose hashes differ in at most max_distance bits.
+        
+        With numpy installed, distances are computed a tile at a time with
+        vectorized XOR + popcount. Otherwise the hashes go into a BK-tree,
+        which only visits the branches that can hold a close enough hash
+        instead of comparing every pair.
+        
+        Args:
+            hashes: List of 64-bit int hashes
+            max_distance: Most differing bits for a pair to count as similar
+            
+        Yields:
+            tuple: (i, j) index pairs
+        """
+        count = len(hashes)
+        if not NUMPY_AVAILABLE:
+            # BK-tree nodes are [hash, indices with that hash, {distance: child}].
+            # Each hash is looked up before it is added, so every pair is found
+            # exactly once, with the earlier index first.
+            root = None
+            for j, hash_j in enumerate(hashes):
+                if root is None:
+                    root = [hash_j, [j], {}]
+                    continue
+                
+                # By the triangle inequality, only children whose edge distance
+                # is within max_distance of this node's distance can match
+                stack = [root]
+                while stack:
+                    node_hash, indices, children = stack.pop()
+                    dist = _popcount(node_hash ^ hash_j)
+                    if dist <= max_distance:
+                        for i in indices:
+                            yield i, j
+                    for edge, child in children.items():
+                        if dist - max_distance <= edge <= dist + max_distance:
+                            stack.append(child)
+                
+                node = root
+                while True:
+                    dist = _popcount(node[0] ^ hash_j)
+                    if dist == 0:
+                        node[1].append(j)
+                        break
+                    child = node[2].get(dist)
+                    if child is None:
+                        node[2][dist] = [hash_j, [j], {}]
+                        break
+                    node = child
+            return
+        
+        values = np.array(hashes, dtype=np.uint64)
+        if hasattr(np, 'bitwise_count'):
+            popcount = np.bitwise_count  # numpy 2.0+
+        else:
+            table = np.array([bin(b).count('1') for b in range(256)], dtype=np.uint8)
+            def popcount(x):
+                return table[x.view(np.uint8)].reshape(x.shape + (8,)).sum(axis=-1)
+        
+        # Square tiles keep the distance matrix small (8 MB) however many images there are
+        tile = self.HAMMING_TILE
+        for row_start in range(0, count, tile):
+            rows = values[row_start:row_start + tile]
+            for col_start in range(row_start, count, tile):
+                cols = values[col_start:col_start + tile]
+                dist = popcount(rows[:, None] ^ cols[None, :])
+                for i, j in np.argwhere(dist <= max_distance):
+                    i += row_start
+                    j += col_start
+                    if i < j:
+                        yield int(i), int(j)
+    
+    def remove_duplicates(self, duplicates, dry_run=False, keep_largest=False):
         """
         Remove duplicate images, keeping the first occurrence.
         
         Args:
-            duplicates: Dictionary of hash to file paths
+            duplicates: Dictionary of hash to (Path, size) tuples, as
+                returned by find_duplicates or find_similar_images
             dry_run: If True, only report what would be done
+            keep_largest: If True, keep the largest file of each group (the
+                best-quality copy of similar images) instead of the first by path
         """
         if not duplicates:
             self.log("No duplicates to remove.")
+            self.flush_output()
             return
         
         self.log("")
@@ -462,18 +1621,19 @@ class DesktopImageOrganizer:
             self.log("REMOVING DUPLICATES")
         self.log("=" * 70)
         
-        for file_hash, file_paths in duplicates.items():
+        for file_hash, files in duplicates.items():
             # Sort by path to keep the first one consistently
-            file_paths.sort()
-            keeper = file_paths[0]
-            duplicates_to_remove = file_paths[1:]
+            if keep_largest:
+                files.sort(key=lambda f: (-f[1], f[0]))
+            else:
+                files.sort()
+            keeper = files[0][0]
+            duplicates_to_remove = files[1:]
             
             self.log(f"\nKeeping: {keeper.name}")
             
-            for dup_path in duplicates_to_remove:
+            for dup_path, file_size in duplicates_to_remove:
                 try:
-                    file_size = dup_path.stat().st_size
-                    
                     if dry_run:
                         self.log(f"  Would remove: {dup_path.name} ({self.format_size(file_size)})")
                         self.stats['space_saved'] += file_size
@@ -499,6 +1659,7 @@ class DesktopImageOrganizer:
             self.log(f"Space saved: {self.format_size(self.stats['space_saved'])}")
         
         self.log("=" * 70)
+        self.flush_output()
     
     def format_size(self, bytes_size):
         """
@@ -516,19 +1677,54 @@ class DesktopImageOrganizer:
             bytes_size /= 1024.0
         return f"{bytes_size:.2f} TB"
     
-    def save_log(self):
-        """Save log messages to a file in the destination folder's logs subfolder."""
+    def open_log_file(self):
+        """
+        Open a new log file in the destination folder's logs subfolder.
+        
+        Messages logged so far are written out first; from then on log()
+        streams each entry to the file as it happens.
+        """
         # Create logs subfolder if it doesn't exist
         logs_folder = self.destination_path / "logs"
-        logs_folder.mkdir(exist_ok=True)
+        logs_folder.mkdir(parents=True, exist_ok=True)
         
         log_file = logs_folder / f"organize_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        # Append, so a second log started within the same second can't clobber the first
+        log_fh = open(log_file, 'a', encoding='utf-8', buffering=1 << 16)
+        with self._lock:
+            try:
+                for entry in self.log_messages:
+                    log_fh.write(entry + '\n')
+            except BaseException:
+                try:
+                    log_fh.close()
+                except OSError:
+                    pass
+                raise
+            self.log_messages.clear()
+            self._log_fh = log_fh
+    
+    def save_log(self):
+        """Finish the current log file, opening one first if needed."""
+        if self._log_fh is None:
+            if not self.log_messages:
+                return  # Nothing logged since the last save
+            try:
+                self.open_log_file()
+            except Exception as e:
+                self.console(f"Error saving log: {str(e)}")
+                self.flush_output()
+                return
+        
+        self.log(f"Log saved to: {self._log_fh.name}")
+        with self._lock:
+            self._write_stdout_buf()
+            log_fh, self._log_fh = self._log_fh, None
         try:
-            with open(log_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(self.log_messages))
-            self.log(f"Log saved to: {log_file}")
+            log_fh.close()
         except Exception as e:
-            print(f"Error saving log: {str(e)}")
+            self.console(f"Error saving log: {str(e)}")
+            self.flush_output()
 
 
 def display_menu(folder_exists):
@@ -649,8 +1845,27 @@ def remove_duplicates_workflow(organizer=None):
     
     if not duplicates:
         print("\nNo duplicates found!")
-        return organizer
+    else:
+        _review_and_remove_duplicates(organizer, duplicates)
     
+    # Near-duplicates need Pillow to decode the images
+    if PIL_AVAILABLE:
+        print()
+        response = input("Also look for visually similar images (resized or re-saved copies)? (y/n): ").strip().lower()
+        if response == 'y':
+            print("\nScanning for similar images...\n")
+            similar = organizer.find_similar_images()
+            if not similar:
+                print("\nNo similar images found!")
+            else:
+                # Keep the largest copy of each picture - usually the best quality
+                _review_and_remove_duplicates(organizer, similar, keep_largest=True)
+    
+    return organizer
+
+
+def _review_and_remove_duplicates(organizer, duplicates, keep_largest=False):
+    """Offer a dry run, then remove the given duplicate groups if confirmed."""
     print()
     response = input("Do you want to see a DRY RUN of duplicate removal first? (y/n): ").strip().lower()
     
@@ -659,22 +1874,20 @@ def remove_duplicates_workflow(organizer=None):
         # Reset stats for dry run
         organizer.stats['duplicates_removed'] = 0
         organizer.stats['space_saved'] = 0
-        organizer.remove_duplicates(duplicates, dry_run=True)
+        organizer.remove_duplicates(duplicates, dry_run=True, keep_largest=keep_largest)
         print()
         response = input("Do you want to proceed with removing duplicates? (y/n): ").strip().lower()
         if response != 'y':
             print("Duplicate removal cancelled.")
-            return organizer
-        
-        # Reset stats for actual run
-        organizer.stats['duplicates_removed'] = 0
-        organizer.stats['space_saved'] = 0
+            return
+    
+    # Reset stats for actual run
+    organizer.stats['duplicates_removed'] = 0
+    organizer.stats['space_saved'] = 0
     
     print("\nRemoving duplicates...\n")
-    organizer.remove_duplicates(duplicates, dry_run=False)
+    organizer.remove_duplicates(duplicates, dry_run=False, keep_largest=keep_largest)
     print("\nDuplicate removal complete!")
-    
-    return organizer
 
 
 def rename_by_date_workflow(organizer=None):
@@ -693,23 +1906,31 @@ def rename_by_date_workflow(organizer=None):
             print("Please run 'Organize Images' first.")
             return None
     
-    if not PIL_AVAILABLE:
+    exif_available = PIL_AVAILABLE or EXIFREAD_AVAILABLE or EXIFTOOL is not None
+    if not exif_available:
         print("Note: Pillow library not installed. Will use file creation dates only.")
         print("      For best results with photos, install Pillow: pip install Pillow")
         print()
         print("Files that already have date prefixes (YYYYMMDD_filename) will be skipped.")
         print()
-    else:
-        print("Pillow detected! Will use EXIF data from photos when available.")
+    elif PIL_AVAILABLE:
+        pillow_name = "Pillow-SIMD" if PIL_SIMD else "Pillow"
+        print(f"{pillow_name} detected! Will use EXIF data from photos when available.")
+        print()
+    elif EXIFREAD_AVAILABLE:
+        print("exifread detected! Will use EXIF data from photos when available.")
+        print()
+    if EXIFTOOL is not None:
+        print("exiftool found - EXIF dates will be read one folder at a time.")
         print()
     
     print("This will rename all images in the folder with date prefixes.")
     print("Format: YYYYMMDD_originalname.ext")
     print()
     
-    # Ask about overriding already-dated files (only if Pillow is available)
+    # Ask about overriding already-dated files (only if EXIF dates can be read)
     force_rename = False
-    if PIL_AVAILABLE:
+    if exif_available:
         print("Files that already have date prefixes (YYYYMMDD_filename) will be skipped by default.")
         response = input("Do you want to override existing dated filenames with EXIF dates? (y/n): ").strip().lower()
         if response == 'y':
@@ -737,57 +1958,65 @@ def rename_by_date_workflow(organizer=None):
     organizer.log(f"Scanning directory: {organizer.destination_path}")
     
     # Debug: Show directory structure
-    print(f"Scanning: {organizer.destination_path}")
-    for root, dirs, files in os.walk(organizer.destination_path):
+    organizer.console(f"Scanning: {organizer.destination_path}")
+    for root, dirs, image_files_in_dir in organizer.walk_image_folders(organizer.destination_path):
         # Debug output for directories
         if dirs:
             organizer.log(f"Found subdirectories in {root}: {dirs}")
-            print(f"  Found {len(dirs)} subdirectories in: {Path(root).name}")
+            organizer.console(f"  Found {len(dirs)} subdirectories in: {os.path.basename(root)}")
         
-        # Debug output for images in this directory
-        image_files_in_dir = [f for f in files if Path(root, f).suffix.lower() in organizer.IMAGE_EXTENSIONS]
-        if image_files_in_dir:
-            print(f"  Processing {Path(root).name}: {len(image_files_in_dir)} images")
+        # Only image files are listed, so log files are skipped
+        if not image_files_in_dir:
+            continue
+        organizer.console(f"  Processing {os.path.basename(root)}: {len(image_files_in_dir)} images")
+        root_path = Path(root)
+        root_dir_str = os.path.join(root, '')
         
-        for file in files:
-            file_path = Path(root) / file
-            
-            # Only process image files, skip log files
-            if organizer.is_image_file(file_path):
-                image_count += 1
-                
-                # Check if already has date prefix (safely handle short filenames)
-                # Skip if file already has date prefix, unless force_rename is True
-                if not force_rename and len(file) >= 9 and file[:8].isdigit() and file[8] == '_':
+        image_count += len(image_files_in_dir)
+        
+        # Check if already has date prefix (safely handle short filenames)
+        # Skip if file already has date prefix, unless force_rename is True
+        if force_rename:
+            to_rename = image_files_in_dir
+        else:
+            to_rename = []
+            for file in image_files_in_dir:
+                if len(file) >= 9 and file[:8].isdigit() and file[8] == '_':
                     skipped_count += 1
                     organizer.log(f"Skipped (already has date prefix): {file}")
-                    continue  # Skip already renamed files
+                else:
+                    to_rename.append(file)
+        
+        # Read EXIF dates for the files being renamed in one exiftool run
+        # (if installed); skipped files are never opened
+        organizer.prefetch_exif_dates([root_dir_str + f for f in to_rename])
+        
+        for file in to_rename:
+            file_path = root_path / file
+            
+            try:
+                new_filename = organizer.generate_dated_filename(file_path)
+                if new_filename == file:
+                    skipped_count += 1
+                    organizer.log(f"Skipped (already named by date): {file}")
+                    continue
+                # Rename without an exists() pre-check; the no-replace move
+                # fails on a taken name, and only then is a suffix added
+                new_path = organizer.move_unique(root_dir_str + file, root_dir_str, new_filename)
+                renamed_count += 1
                 
-                try:
-                    new_filename = organizer.generate_dated_filename(file_path)
-                    new_path = file_path.parent / new_filename
-                    
-                    # Handle conflicts
-                    if new_path.exists():
-                        stem = Path(new_filename).stem
-                        suffix = Path(new_filename).suffix
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S%f")
-                        new_path = file_path.parent / f"{stem}_{timestamp}{suffix}"
-                    
-                    file_path.rename(new_path)
-                    renamed_count += 1
-                    
-                    if renamed_count % 10 == 0:
-                        print(f"  Renamed {renamed_count} images...")
-                    
-                    organizer.log(f"Renamed: {file} → {new_path.name}")
-                    
-                except Exception as e:
-                    error_count += 1
-                    error_msg = f"Error renaming {file}: {str(e)}"
-                    organizer.log(error_msg)
-                    print(f"  ⚠ {error_msg}")
+                if renamed_count % 10 == 0:
+                    organizer.console(f"  Renamed {renamed_count} images...")
+                
+                organizer.log(f"Renamed: {file} → {os.path.basename(new_path)}")
+                
+            except Exception as e:
+                error_count += 1
+                error_msg = f"Error renaming {file}: {str(e)}"
+                organizer.log(error_msg)
+                organizer.console(f"  ⚠ {error_msg}")
     
+    organizer.flush_output()
     print(f"\nRenaming complete!")
     print(f"Total images found: {image_count}")
     print(f"Renamed: {renamed_count}")
@@ -800,6 +2029,7 @@ def rename_by_date_workflow(organizer=None):
     organizer.log(f"Skipped (already dated): {skipped_count}")
     organizer.log(f"Errors: {error_count}")
     organizer.log("=" * 70)
+    organizer.flush_output()
     
     return organizer
 
@@ -808,11 +2038,11 @@ def main():
     """Main entry point with menu system."""
     organizer = None
     
+    # Check once whether the destination folder exists; only organizing
+    # can create it, so the menu doesn't need to re-check on every redraw
+    folder_exists = DesktopImageOrganizer().destination_path.exists()
+    
     while True:
-        # Check if destination folder exists
-        temp_organizer = DesktopImageOrganizer()
-        folder_exists = temp_organizer.destination_path.exists()
-        
         # Display menu and get choice
         choice = display_menu(folder_exists)
         
@@ -820,6 +2050,7 @@ def main():
             # Organize Images
             organizer = organize_images_workflow()
             if organizer:
+                folder_exists = True
                 organizer.save_log()
                 print("\nPress Enter to return to menu...")
                 input()
@@ -875,6 +2106,8 @@ def main():
             organizer = organize_images_workflow()
             
             if organizer:
+                folder_exists = True
+                
                 # Step 2: Remove Duplicates
                 print()
                 response = input("Continue to duplicate removal? (y/n): ").strip().lower()